@@ -1,8 +1,15 @@
 
 from typing import Any, Dict, Optional, List
+import atexit
+import asyncio
+import re
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 import httpx
-import json
-import base64
+import orjson
+import pybase64
+from cachetools import LRUCache
 from mcp.server.fastmcp import FastMCP
 import os
 from dotenv import load_dotenv
@@ -10,12 +17,42 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+_prewarmed = False
+
+
+async def _prewarm() -> None:
+    """Issue one HEAD to GitHub so DNS resolution and the TLS handshake
+    are paid once per process rather than by the first tool call."""
+    global _prewarmed
+    if _prewarmed:
+        return
+    _prewarmed = True
+    try:
+        await _CLIENT.head("/")
+    except Exception:
+        pass
+
+
+@asynccontextmanager
+async def _lifespan(_server):
+    """Prewarm before the first session served by mcp.run(); the low-level
+    server enters this per MCP session, so _prewarm guards itself to one
+    round-trip per process."""
+    await _prewarm()
+    yield
+
+
 # Initialize FastMCP server
 mcp = FastMCP(
     name="gitHub",
     host="0.0.0.0",
     port=8080,
-    path="/mcp"
+    path="/mcp",
+    lifespan=_lifespan,
+    # Sessions must be stateless for the multi-worker uvicorn deployment:
+    # workers share the listen socket with no session affinity, so a
+    # stateful session pinned to one worker would 404 on the others.
+    stateless_http=True
 )
 
 # Constants
@@ -23,82 +60,303 @@ GITHUB_API_BASE = "https://api.github.com"
 USER_AGENT = "github-mcp-app/1.0"
 GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
 
+# API route templates bound once at import; building a URL is then one
+# C-level format call instead of per-call f-string interpolation, and
+# the routes live in one place.
+_URL_SEARCH_REPOS = GITHUB_API_BASE + "/search/repositories"
+_URL_USER_REPOS = GITHUB_API_BASE + "/user/repos"
+_URL_REPO = (GITHUB_API_BASE + "/repos/{}/{}").format
+_URL_ISSUES = (GITHUB_API_BASE + "/repos/{}/{}/issues").format
+_URL_BRANCHES = (GITHUB_API_BASE + "/repos/{}/{}/branches").format
+_URL_GIT_REFS = (GITHUB_API_BASE + "/repos/{}/{}/git/refs").format
+_URL_GIT_REF_HEAD = (GITHUB_API_BASE + "/repos/{}/{}/git/refs/heads/{}").format
+_URL_CONTENTS = (GITHUB_API_BASE + "/repos/{}/{}/contents/{}").format
+_URL_PULLS = (GITHUB_API_BASE + "/repos/{}/{}/pulls").format
+_URL_PULL_MERGE = (GITHUB_API_BASE + "/repos/{}/{}/pulls/{}/merge").format
+_URL_HOOKS = (GITHUB_API_BASE + "/repos/{}/{}/hooks").format
+_URL_HOOK = (GITHUB_API_BASE + "/repos/{}/{}/hooks/{}").format
+_URL_ACTION_RUNS = (GITHUB_API_BASE + "/repos/{}/{}/actions/runs").format
+
+_DEFAULT_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept": "application/vnd.github.v3+json",
+    "Content-Type": "application/json",
+}
+if GITHUB_TOKEN:
+    _DEFAULT_HEADERS["Authorization"] = f"Bearer {GITHUB_TOKEN}"
+
+# Shared client so connections (TCP + TLS) are kept alive and reused
+# across tool calls instead of being re-established per request.
+_CLIENT = httpx.AsyncClient(
+    base_url=GITHUB_API_BASE,
+    headers=_DEFAULT_HEADERS,
+    transport=httpx.AsyncHTTPTransport(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        # Absorb transient DNS/connect hiccups without surfacing an error.
+        retries=2,
+    ),
+    timeout=30.0,
+)
+
+
+def _close_client() -> None:
+    """Close the shared client's pooled connections at interpreter exit."""
+    try:
+        asyncio.run(_CLIENT.aclose())
+    except Exception:
+        pass
+
+
+atexit.register(_close_client)
+
+# ETag cache for GET responses. GitHub honours If-None-Match with a 304
+# that carries no body and doesn't count against the rate limit, so
+# repeated reads with identical arguments skip the JSON download.
+_etag_cache: LRUCache = LRUCache(maxsize=512)
+
+
+def _cache_key(url: str, params: Optional[Dict[str, Any]]) -> tuple:
+    return (url, tuple(sorted(params.items())) if params else None)
+
+
+# Cap in-flight requests so gather-based pagination can't stampede the API.
+_REQUEST_SEMAPHORE = asyncio.Semaphore(20)
+
+
+@dataclass
+class _RateState:
+    """Last-seen GitHub rate-limit window, updated from response headers."""
+    remaining: int = 5000
+    reset: float = 0.0
+
+
+_rate_state = _RateState()
+
+
+def _update_rate_state(response: httpx.Response) -> None:
+    remaining = response.headers.get("X-RateLimit-Remaining")
+    reset = response.headers.get("X-RateLimit-Reset")
+    if remaining is not None:
+        _rate_state.remaining = int(remaining)
+    if reset is not None:
+        _rate_state.reset = float(reset)
+
+
+async def _throttle() -> None:
+    """Sleep until the rate-limit window resets if we're nearly out of quota."""
+    if _rate_state.remaining < 10:
+        delay = _rate_state.reset - time.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def _rate_limited(response: httpx.Response) -> bool:
+    return (
+        response.status_code == 403
+        and response.headers.get("X-RateLimit-Remaining") == "0"
+    )
+
 
 async def make_github_request(
     url: str,
     method: str = "GET",
-    json: Optional[Dict[str, Any]] = None
+    json_body: Optional[Dict[str, Any]] = None,
+    params: Optional[Dict[str, Any]] = None,
+    content: Optional[bytes] = None
 ) -> Optional[Dict[str, Any]]:
-    """Make a request to the GitHub API with error handling."""
-    headers = {
-        "User-Agent": USER_AGENT,
-        "Accept": "application/vnd.github.v3+json",
-    }
-    if GITHUB_TOKEN:
-        headers["Authorization"] = f"Bearer {GITHUB_TOKEN}"
+    """Make a request to the GitHub API with error handling.
+
+    Request bodies may be passed either as a dict via ``json_body`` (serialized
+    here with orjson) or pre-serialized as bytes via ``content`` - callers
+    with static payloads can dump them once at import and reuse the bytes.
+    """
+    try:
+        headers = None
+        cached = None
+        if method == "GET":
+            cached = _etag_cache.get(_cache_key(url, params))
+            if cached:
+                headers = {"If-None-Match": cached[0]}
+
+        body = content if content is not None else (
+            orjson.dumps(json_body) if json_body is not None else None
+        )
+        async with _REQUEST_SEMAPHORE:
+            await _throttle()
+            response = await _CLIENT.request(method, url, content=body, params=params, headers=headers)
+            _update_rate_state(response)
+            if _rate_limited(response):
+                # Out of quota: wait for the window to reset, then retry once
+                # instead of burning another round-trip on a guaranteed 403.
+                await _throttle()
+                response = await _CLIENT.request(method, url, content=body, params=params, headers=headers)
+                _update_rate_state(response)
+        if cached and response.status_code == 304:
+            return cached[1]
+        response.raise_for_status()
+        if response.status_code == 204:
+            # No Content (e.g. deletes) - nothing to parse or allocate.
+            return None
+        data = orjson.loads(response.content) if response.content else {}
+
+        if method == "GET":
+            etag = response.headers.get("ETag")
+            if etag:
+                _etag_cache[_cache_key(url, params)] = (
+                    etag, data, response.headers.get("Link", "")
+                )
+        return data
+    except httpx.HTTPStatusError as e:
+        return {
+            "error": f"GitHub API request failed: {str(e)}",
+            "status": e.response.status_code,
+        }
+    except Exception as e:
+        # Log or handle the error as needed
+        return {"error": f"GitHub API request failed: {str(e)}"}
+
+
+async def _get(url: str, params: Dict[str, Any]) -> tuple:
+    """GET through the shared client, honouring the request cap and quota.
+
+    Shares the ETag cache with make_github_request: entries store the Link
+    header alongside the parsed body, so a 304 still lets pagination read
+    the last-page number. Returns (parsed body, Link header).
+    """
+    cache_key = _cache_key(url, params)
+    cached = _etag_cache.get(cache_key)
+    headers = {"If-None-Match": cached[0]} if cached else None
+
+    async with _REQUEST_SEMAPHORE:
+        await _throttle()
+        response = await _CLIENT.get(url, params=params, headers=headers)
+    _update_rate_state(response)
+
+    if cached and response.status_code == 304:
+        return cached[1], cached[2]
+    response.raise_for_status()
+    data = orjson.loads(response.content) if response.content else []
+    link = response.headers.get("Link", "")
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.request(method, url, headers=headers, json=json, timeout=30.0)
-            response.raise_for_status()
-            return response.json() if response.content else {}
-        except Exception as e:
-            # Log or handle the error as needed
-            return {"error": f"GitHub API request failed: {str(e)}"}
+    etag = response.headers.get("ETag")
+    if etag:
+        _etag_cache[cache_key] = (etag, data, link)
+    return data, link
+
+
+# Matches the page number of the rel="last" entry in a Link header.
+_LINK_LAST_PAGE = re.compile(r'[?&]page=(\d+)[^>]*>;\s*rel="last"')
+
+
+async def _paginate(url: str, params: Optional[Dict[str, Any]] = None) -> Any:
+    """Fetch every page of a list endpoint, requesting pages 2..N concurrently.
+
+    Page 1 is fetched first so the Link header can reveal the last page
+    number; the remaining pages are then gathered in parallel over the
+    shared HTTP/2 connection.
+    """
+    params = dict(params or {})
+    params.setdefault("per_page", 100)
+    try:
+        results, link = await _get(url, params={**params, "page": 1})
+
+        match = _LINK_LAST_PAGE.search(link)
+        if match:
+            last_page = int(match.group(1))
+            pages = await asyncio.gather(*[
+                _get(url, params={**params, "page": page})
+                for page in range(2, last_page + 1)
+            ])
+            # Copy before extending - page bodies may live in the ETag cache.
+            results = list(results)
+            for page_results, _ in pages:
+                results.extend(page_results)
+        return results
+    except Exception as e:
+        return {"error": f"GitHub API request failed: {str(e)}"}
+
+
+# Record templates compiled once at import; calling the bound .format
+# method is a single C-level call instead of per-field interpolation.
+_REPO_TEMPLATE = "Name: {}\nDescription: {}\nStars: {}\nURL: {}".format
+_ISSUE_TEMPLATE = "Issue #{}\nTitle: {}\nState: {}\nURL: {}".format
+_PR_TEMPLATE = "PR #{}\nTitle: {}\nState: {}\nURL: {}".format
+_BRANCH_TEMPLATE = "Name: {}\nSHA: {}\nURL: {}".format
+_WEBHOOK_TEMPLATE = "ID: {}\nType: {}\nEvents: {}\nURL: {}\nActive: {}".format
 
 
 def format_repository(repo: Dict[str, Any]) -> str:
     """Format a GitHub repository into a readable string."""
-    return (
-        f"Name: {repo.get('full_name', 'Unknown')}\n"
-        f"Description: {repo.get('description', 'No description')}\n"
-        f"Stars: {repo.get('stargazers_count', 0)}\n"
-        f"URL: {repo.get('html_url', 'No URL')}"
+    return _REPO_TEMPLATE(
+        repo.get('full_name', 'Unknown'),
+        repo.get('description', 'No description'),
+        repo.get('stargazers_count', 0),
+        repo.get('html_url', 'No URL'),
     )
 
 
+def _format_repository_list(repos: List[Dict[str, Any]]) -> str:
+    """Format many repositories with one join over individual lines.
+
+    Separator lines are interleaved directly, so large result sets are
+    assembled by a single C-level join instead of building a formatted
+    string per record and joining those again.
+    """
+    lines: List[str] = []
+    for repo in repos:
+        lines.append(f"Name: {repo.get('full_name', 'Unknown')}")
+        lines.append(f"Description: {repo.get('description', 'No description')}")
+        lines.append(f"Stars: {repo.get('stargazers_count', 0)}")
+        lines.append(f"URL: {repo.get('html_url', 'No URL')}")
+        lines.append("---")
+    if lines:
+        lines.pop()
+    return "\n".join(lines)
+
+
 def format_issue(issue: Dict[str, Any]) -> str:
     """Format a GitHub issue into a readable string."""
-    return (
-        f"Issue #{issue.get('number', 'Unknown')}\n"
-        f"Title: {issue.get('title', 'No title')}\n"
-        f"State: {issue.get('state', 'Unknown')}\n"
-        f"URL: {issue.get('html_url', 'No URL')}"
+    return _ISSUE_TEMPLATE(
+        issue.get('number', 'Unknown'),
+        issue.get('title', 'No title'),
+        issue.get('state', 'Unknown'),
+        issue.get('html_url', 'No URL'),
     )
 
 
 def format_pull_request(pr: Dict[str, Any]) -> str:
     """Format a GitHub pull request into a readable string."""
-    return (
-        f"PR #{pr.get('number', 'Unknown')}\n"
-        f"Title: {pr.get('title', 'No title')}\n"
-        f"State: {pr.get('state', 'Unknown')}\n"
-        f"URL: {pr.get('html_url', 'No URL')}"
+    return _PR_TEMPLATE(
+        pr.get('number', 'Unknown'),
+        pr.get('title', 'No title'),
+        pr.get('state', 'Unknown'),
+        pr.get('html_url', 'No URL'),
     )
 
 
 def format_branch(branch: Dict[str, Any]) -> str:
     """Format a GitHub branch into a readable string."""
-    return (
-        f"Name: {branch.get('name', 'Unknown')}\n"
-        f"SHA: {branch.get('commit', {}).get('sha', 'Unknown')}\n"
-        f"URL: {branch.get('_links', {}).get('html', 'No URL')}"
+    return _BRANCH_TEMPLATE(
+        branch.get('name', 'Unknown'),
+        branch.get('commit', {}).get('sha', 'Unknown'),
+        branch.get('_links', {}).get('html', 'No URL'),
     )
 
 
 def format_webhook(webhook: Dict[str, Any]) -> str:
     """Format a GitHub webhook into a readable string."""
-    return (
-        f"ID: {webhook.get('id', 'Unknown')}\n"
-        f"Type: {webhook.get('type', 'Unknown')}\n"
-        f"Events: {', '.join(webhook.get('events', []))}\n"
-        f"URL: {webhook.get('config', {}).get('url', 'No URL')}\n"
-        f"Active: {webhook.get('active', False)}"
+    return _WEBHOOK_TEMPLATE(
+        webhook.get('id', 'Unknown'),
+        webhook.get('type', 'Unknown'),
+        ', '.join(webhook.get('events', [])),
+        webhook.get('config', {}).get('url', 'No URL'),
+        webhook.get('active', False),
     )
 
 
 @mcp.tool()
-async def search_repositories(query: str, per_page: int = 30, page: int = 1) -> str:
+async def search_repositories(query: str, per_page: int = 30, page: int = 1, max_results: Optional[int] = None) -> str:
     """
     Search GitHub repositories by query.
 
@@ -106,9 +364,40 @@ async def search_repositories(query: str, per_page: int = 30, page: int = 1) ->
         query: Search keywords.
         per_page: Number of results per page (max 100).
         page: Page number.
+        max_results: If set, fetch up to this many results (capped at
+            GitHub's 1000-item search limit) by requesting the needed
+            pages concurrently; overrides per_page and page.
     """
-    url = f"{GITHUB_API_BASE}/search/repositories?q={query}&per_page={per_page}&page={page}"
-    data = await make_github_request(url)
+    url = _URL_SEARCH_REPOS
+
+    # Tool arguments come from LLM clients, so a non-positive max_results
+    # falls through to the single-page path instead of raising.
+    if max_results is not None and max_results > 0:
+        # Fan the page fetches out in parallel instead of paying one
+        # round-trip per page; GitHub caps search results at 1000.
+        max_results = min(max_results, 1000)
+        pages = -(-max_results // 100)
+        results = await asyncio.gather(*[
+            make_github_request(url, params={"q": query, "per_page": 100, "page": p})
+            for p in range(1, pages + 1)
+        ])
+
+        if not results[0] or "items" not in results[0]:
+            return "Unable to fetch repositories or no repositories found."
+
+        items: List[Dict[str, Any]] = []
+        for data in results:
+            if data and "items" in data:
+                items.extend(data["items"])
+        items = items[:max_results]
+
+        if not items:
+            return "No repositories found for this query."
+
+        return _format_repository_list(items)
+
+    params = {"q": query, "per_page": per_page, "page": page}
+    data = await make_github_request(url, params=params)
 
     if not data or "items" not in data:
         return "Unable to fetch repositories or no repositories found."
@@ -116,8 +405,7 @@ async def search_repositories(query: str, per_page: int = 30, page: int = 1) ->
     if not data["items"]:
         return "No repositories found for this query."
 
-    repos = [format_repository(repo) for repo in data["items"]]
-    return "\n---\n".join(repos)
+    return _format_repository_list(data["items"])
 
 
 @mcp.tool()
@@ -131,9 +419,9 @@ async def create_issue(owner: str, repo: str, title: str, body: str) -> str:
         title: Issue title.
         body: Issue description.
     """
-    url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/issues"
+    url = _URL_ISSUES(owner, repo)
     payload = {"title": title, "body": body}
-    data = await make_github_request(url, method="POST", json=payload)
+    data = await make_github_request(url, method="POST", json_body=payload)
 
     if not data or "error" in data:
         return f"Unable to create issue: {data.get('error', 'Unknown error')}"
@@ -152,14 +440,14 @@ async def create_repository(name: str, description: str = "", private: bool = Fa
         description: Repository description.
         private: Whether the repository should be private.
     """
-    url = f"{GITHUB_API_BASE}/user/repos"
+    url = _URL_USER_REPOS
     payload = {
         "name": name,
         "description": description,
         "private": private,
         "auto_init": True
     }
-    data = await make_github_request(url, method="POST", json=payload)
+    data = await make_github_request(url, method="POST", json_body=payload)
 
     if not data or "error" in data:
         return f"Unable to create repository: {data.get('error', 'Unknown error')}"
@@ -176,7 +464,7 @@ async def delete_repository(owner: str, repo: str) -> str:
         owner: Repository owner.
         repo: Repository name.
     """
-    url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}"
+    url = _URL_REPO(owner, repo)
     data = await make_github_request(url, method="DELETE")
 
     if data and "error" in data:
@@ -195,8 +483,8 @@ async def list_branches(owner: str, repo: str) -> str:
         owner: Repository owner.
         repo: Repository name.
     """
-    url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/branches"
-    data = await make_github_request(url)
+    url = _URL_BRANCHES(owner, repo)
+    data = await _paginate(url)
 
     if not data or "error" in data:
         return f"Unable to list branches: {data.get('error', 'Unknown error')}"
@@ -204,8 +492,7 @@ async def list_branches(owner: str, repo: str) -> str:
     if not data:
         return "No branches found."
 
-    branches = [format_branch(branch) for branch in data]
-    return "\n---\n".join(branches)
+    return "\n---\n".join(format_branch(branch) for branch in data)
 
 
 @mcp.tool()
@@ -220,7 +507,7 @@ async def create_branch(owner: str, repo: str, branch_name: str, source_branch:
         source_branch: Source branch to create from.
     """
     # Get the SHA of the source branch
-    url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/git/refs/heads/{source_branch}"
+    url = _URL_GIT_REF_HEAD(owner, repo, source_branch)
     data = await make_github_request(url)
 
     if not data or "error" in data:
@@ -231,12 +518,12 @@ async def create_branch(owner: str, repo: str, branch_name: str, source_branch:
         return "Unable to get source branch SHA."
 
     # Create the new branch
-    url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/git/refs"
+    url = _URL_GIT_REFS(owner, repo)
     payload = {
         "ref": f"refs/heads/{branch_name}",
         "sha": sha
     }
-    data = await make_github_request(url, method="POST", json=payload)
+    data = await make_github_request(url, method="POST", json_body=payload)
 
     if not data or "error" in data:
         return f"Unable to create branch: {data.get('error', 'Unknown error')}"
@@ -254,7 +541,7 @@ async def delete_branch(owner: str, repo: str, branch_name: str) -> str:
         repo: Repository name.
         branch_name: Name of the branch to delete.
     """
-    url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/git/refs/heads/{branch_name}"
+    url = _URL_GIT_REF_HEAD(owner, repo, branch_name)
     data = await make_github_request(url, method="DELETE")
 
     if data and "error" in data:
@@ -264,6 +551,12 @@ async def delete_branch(owner: str, repo: str, branch_name: str) -> str:
 
 
 # File Management Tools
+
+# SHAs of files written this session, so repeat updates to the same path
+# can skip the GET that would otherwise be needed to discover the SHA.
+_file_sha_cache: Dict[tuple, str] = {}
+
+
 @mcp.tool()
 async def create_or_update_file(owner: str, repo: str, path: str, content: str, message: str, branch: str = "main") -> str:
     """
@@ -277,26 +570,37 @@ async def create_or_update_file(owner: str, repo: str, path: str, content: str,
         message: Commit message.
         branch: Branch name.
     """
-    url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/contents/{path}"
-    
-    # Check if file exists
-    existing_file = await make_github_request(url, params={"ref": branch})
-    
+    url = _URL_CONTENTS(owner, repo, path)
+    cache_key = (owner, repo, path, branch)
+
     payload = {
         "message": message,
-        "content": base64.b64encode(content.encode()).decode(),
+        "content": pybase64.b64encode(content.encode("utf-8")).decode("ascii"),
         "branch": branch
     }
-    
-    # If file exists, we need to include the SHA
-    if existing_file and not "error" in existing_file:
-        payload["sha"] = existing_file.get("sha")
-    
-    data = await make_github_request(url, method="PUT", json=payload)
-    
+
+    # Try the PUT directly: new files need no SHA, and for files written
+    # earlier this session we already know it. Only on a conflict (the file
+    # exists, or our cached SHA went stale) fall back to a GET for the SHA.
+    cached_sha = _file_sha_cache.get(cache_key)
+    if cached_sha:
+        payload["sha"] = cached_sha
+
+    data = await make_github_request(url, method="PUT", json_body=payload)
+
+    if data and data.get("status") in (409, 422):
+        existing_file = await make_github_request(url, params={"ref": branch})
+        if existing_file and "error" not in existing_file:
+            payload["sha"] = existing_file.get("sha")
+            data = await make_github_request(url, method="PUT", json_body=payload)
+
     if not data or "error" in data:
         return f"Unable to create/update file: {data.get('error', 'Unknown error')}"
-    
+
+    new_sha = (data.get("content") or {}).get("sha")
+    if new_sha:
+        _file_sha_cache[cache_key] = new_sha
+
     return f"File '{path}' created/updated successfully in branch '{branch}'."
 
 
@@ -314,14 +618,14 @@ async def create_pull_request(owner: str, repo: str, title: str, head: str, base
         base: The name of the branch you want the changes pulled into.
         body: Pull request description.
     """
-    url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/pulls"
+    url = _URL_PULLS(owner, repo)
     payload = {
         "title": title,
         "head": head,
         "base": base,
         "body": body
     }
-    data = await make_github_request(url, method="POST", json=payload)
+    data = await make_github_request(url, method="POST", json_body=payload)
 
     if not data or "error" in data:
         return f"Unable to create pull request: {data.get('error', 'Unknown error')}"
@@ -339,9 +643,8 @@ async def list_pull_requests(owner: str, repo: str, state: str = "open") -> str:
         repo: Repository name.
         state: Pull request state (open, closed, all).
     """
-    url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/pulls"
-    params = {"state": state}
-    data = await make_github_request(url, params=params)
+    url = _URL_PULLS(owner, repo)
+    data = await _paginate(url, params={"state": state})
 
     if not data or "error" in data:
         return f"Unable to list pull requests: {data.get('error', 'Unknown error')}"
@@ -349,8 +652,7 @@ async def list_pull_requests(owner: str, repo: str, state: str = "open") -> str:
     if not data:
         return f"No {state} pull requests found."
 
-    prs = [format_pull_request(pr) for pr in data]
-    return "\n---\n".join(prs)
+    return "\n---\n".join(format_pull_request(pr) for pr in data)
 
 
 @mcp.tool()
@@ -364,12 +666,12 @@ async def merge_pull_request(owner: str, repo: str, pull_number: int, commit_tit
         pull_number: Pull request number.
         commit_title: Title for the merge commit.
     """
-    url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/pulls/{pull_number}/merge"
+    url = _URL_PULL_MERGE(owner, repo, pull_number)
     payload = {}
     if commit_title:
         payload["commit_title"] = commit_title
 
-    data = await make_github_request(url, method="PUT", json=payload)
+    data = await make_github_request(url, method="PUT", json_body=payload)
 
     if not data or "error" in data:
         return f"Unable to merge pull request: {data.get('error', 'Unknown error')}"
@@ -389,7 +691,7 @@ async def create_webhook(owner: str, repo: str, url: str, events: List[str] = ["
         url: Webhook payload URL.
         events: Events that trigger the webhook.
     """
-    api_url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/hooks"
+    api_url = _URL_HOOKS(owner, repo)
     payload = {
         "config": {
             "url": url,
@@ -398,7 +700,7 @@ async def create_webhook(owner: str, repo: str, url: str, events: List[str] = ["
         "events": events,
         "active": True
     }
-    data = await make_github_request(api_url, method="POST", json=payload)
+    data = await make_github_request(api_url, method="POST", json_body=payload)
 
     if not data or "error" in data:
         return f"Unable to create webhook: {data.get('error', 'Unknown error')}"
@@ -415,8 +717,8 @@ async def list_webhooks(owner: str, repo: str) -> str:
         owner: Repository owner.
         repo: Repository name.
     """
-    url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/hooks"
-    data = await make_github_request(url)
+    url = _URL_HOOKS(owner, repo)
+    data = await _paginate(url)
 
     if not data or "error" in data:
         return f"Unable to list webhooks: {data.get('error', 'Unknown error')}"
@@ -424,8 +726,7 @@ async def list_webhooks(owner: str, repo: str) -> str:
     if not data:
         return "No webhooks found."
 
-    webhooks = [format_webhook(webhook) for webhook in data]
-    return "\n---\n".join(webhooks)
+    return "\n---\n".join(format_webhook(webhook) for webhook in data)
 
 
 @mcp.tool()
@@ -438,7 +739,7 @@ async def delete_webhook(owner: str, repo: str, webhook_id: int) -> str:
         repo: Repository name.
         webhook_id: Webhook ID.
     """
-    url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/hooks/{webhook_id}"
+    url = _URL_HOOK(owner, repo, webhook_id)
     data = await make_github_request(url, method="DELETE")
 
     if data and "error" in data:
@@ -447,6 +748,36 @@ async def delete_webhook(owner: str, repo: str, webhook_id: int) -> str:
     return f"Webhook {webhook_id} deleted successfully."
 
 
+# Aggregate Tools
+@mcp.tool()
+async def repo_overview(owner: str, repo: str) -> str:
+    """
+    Get branches, open pull requests and webhooks for a repository in one call.
+
+    Args:
+        owner: Repository owner.
+        repo: Repository name.
+    """
+    branches, prs, webhooks = await asyncio.gather(
+        _paginate(_URL_BRANCHES(owner, repo)),
+        _paginate(_URL_PULLS(owner, repo), params={"state": "open"}),
+        _paginate(_URL_HOOKS(owner, repo)),
+    )
+
+    def _section(title: str, items: Any, formatter) -> str:
+        if isinstance(items, dict) and "error" in items:
+            return f"{title}: {items['error']}"
+        if not items:
+            return f"{title}: none"
+        return f"{title}:\n" + "\n---\n".join(formatter(item) for item in items)
+
+    return "\n\n".join((
+        _section("Branches", branches, format_branch),
+        _section("Open pull requests", prs, format_pull_request),
+        _section("Webhooks", webhooks, format_webhook),
+    ))
+
+
 # GitHub Actions Tools
 @mcp.tool()
 async def list_workflow_runs(owner: str, repo: str, workflow_id: str = None) -> str:
@@ -458,10 +789,12 @@ async def list_workflow_runs(owner: str, repo: str, workflow_id: str = None) ->
         repo: Repository name.
         workflow_id: Optional workflow ID to filter by.
     """
-    base_url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/actions/runs"
+    base_url = _URL_ACTION_RUNS(owner, repo)
     url = f"{base_url}/{workflow_id}/runs" if workflow_id else base_url
-    
-    data = await make_github_request(url)
+
+    # Only 10 runs are shown, so only ask the API for 10 - workflow_runs
+    # bodies are huge and the rest would be downloaded just to be dropped.
+    data = await make_github_request(url, params={"per_page": 10})
 
     if not data or "error" in data:
         return f"Unable to list workflow runs: {data.get('error', 'Unknown error')}"
@@ -470,7 +803,7 @@ async def list_workflow_runs(owner: str, repo: str, workflow_id: str = None) ->
         return "No workflow runs found."
 
     runs = []
-    for run in data.get("workflow_runs", [])[:10]:  # Limit to 10 runs
+    for run in data.get("workflow_runs", []):
         runs.append(
             f"Run #{run.get('id')}\n"
             f"Name: {run.get('name')}\n"
@@ -482,6 +815,31 @@ async def list_workflow_runs(owner: str, repo: str, workflow_id: str = None) ->
     return "\n---\n".join(runs)
 
 
+# ASGI app for running under uvicorn with multiple workers, e.g.:
+#   uvicorn server:app --host 0.0.0.0 --port 8080 --workers $(nproc) --loop uvloop
+# mcp.run() below stays as the single-process entrypoint.
+app = mcp.streamable_http_app()
+
+# Wrap the app lifespan so each uvicorn worker prewarms the GitHub
+# connection at process startup, before any request arrives.
+_session_manager_lifespan = app.router.lifespan_context
+
+
+@asynccontextmanager
+async def _app_lifespan(asgi_app):
+    await _prewarm()
+    async with _session_manager_lifespan(asgi_app):
+        yield
+
+
+app.router.lifespan_context = _app_lifespan
+
+
 if __name__ == "__main__":
+    # Replace the default asyncio event loop with uvloop (libuv-based)
+    # to cut per-request event-loop overhead on the async I/O paths.
+    import uvloop
+    uvloop.install()
+
     # Run the MCP server with streamable-http transport
     mcp.run(transport="streamable-http")